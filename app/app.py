@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import bisect
 import functools
-import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pika.exceptions
+import pulsar
 from cloudevents.events import (
     Event,
     EventOutcome,
@@ -19,41 +21,144 @@ from viaa.observability import logging
 from app.services.org_api import OrgApiClient
 from app.services.pulsar import PulsarClient, PRODUCER_TOPIC
 from app.services import rabbit
-from app.helpers.bag import Bag
+from app.helpers.bag import Bag, md5_file_fast
 from app.helpers.sidecar import InvalidSidecarException, Sidecar
 from app.helpers.events import WatchfolderMessage, InvalidMessageException
 
 APP_NAME = "legacy-sipin-sip-creator"
 
+# Precomputed outcome values for the event data payloads
+OUTCOME_SUCCESS = EventOutcome.SUCCESS.to_str()
+OUTCOME_FAIL = EventOutcome.FAIL.to_str()
+
+# How long pending batched acks may wait before they are flushed, in seconds
+ACK_FLUSH_INTERVAL = 0.1
+
 
 class EventListener:
+    __slots__ = (
+        "log",
+        "config",
+        "rabbit_client",
+        "pulsar_client",
+        "org_api_client",
+        "_host",
+        "_ack_lock",
+        "_ack_channel",
+        "_settled_tags",
+        "_highest_settled_tag",
+        "_ack_backlog",
+        "_ack_batch_size",
+        "_executor",
+        "_schedule",
+    )
+
     def __init__(self):
         configParser = ConfigParser()
         self.log = logging.get_logger(__name__, config=configParser)
         self.config = configParser.app_cfg
-        self.threads = []
+        # Cache the values reused for every message
+        self._host = self.config["host"]
+        # Batched acks: completed delivery tags are collected and acked in
+        # one multi-ack frame instead of one network round-trip per message.
+        self._ack_lock = threading.Lock()
+        self._ack_channel = None
+        self._settled_tags = []
+        self._highest_settled_tag = 0
+        self._ack_backlog = 0
         # Init RabbitMQ client
         try:
             self.rabbit_client = rabbit.RabbitClient()
         except pika.exceptions.AMQPConnectionError as error:
             self.log.error("Connection to RabbitMQ failed.")
             raise error
+        # Cache the bound scheduler, so the ack/nack hot path doesn't
+        # re-resolve the connection attributes per message
+        self._schedule = self.rabbit_client.connection.add_callback_threadsafe
         # Init Pusar client
         self.pulsar_client = PulsarClient()
         # Init org API client
         self.org_api_client = OrgApiClient()
+        # Flush the pending acks once half the prefetch window is settled
+        self._ack_batch_size = max(1, self.rabbit_client.prefetch_count // 2)
+        # Worker pool sized to the prefetch window, so the number of SIPs
+        # being created concurrently is bounded by the unacked deliveries.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.rabbit_client.prefetch_count),
+            thread_name_prefix="sip-creator",
+        )
+        # Besides the threshold flush, flush on a short timer: when a burst
+        # ends below the threshold, the remaining acks would otherwise wait
+        # until the next burst or process shutdown.
+        self.rabbit_client.connection.call_later(
+            ACK_FLUSH_INTERVAL, self._periodic_flush
+        )
 
-    def ack_message(self, channel, delivery_tag):
-        if channel.is_open:
-            channel.basic_ack(delivery_tag)
+    def _track_ack_channel(self, channel):
+        """Reset the batched-ack state when the ack channel changes.
+
+        After a reconnect the broker delivers on a fresh channel and the
+        delivery tags restart at 1, so the previous channel's watermark and
+        pending tags no longer apply. Must be called with the ack lock held.
+        """
+        if channel is not self._ack_channel:
+            self._ack_channel = channel
+            self._settled_tags = []
+            self._highest_settled_tag = 0
+            self._ack_backlog = 0
+
+    def _advance_settled_tag(self):
+        """Advance the highest contiguous settled delivery tag.
+
+        Delivery tags are settled out of order as worker threads finish. Only
+        the highest tag for which all lower tags are settled as well can be
+        covered by a multi-ack. Must be called with the ack lock held.
+        """
+        while (
+            self._settled_tags
+            and self._settled_tags[0] == self._highest_settled_tag + 1
+        ):
+            self._highest_settled_tag = self._settled_tags.pop(0)
+            self._ack_backlog += 1
+
+    def _flush_acks(self):
+        """Ack all messages up to the highest contiguous settled tag at once."""
+        with self._ack_lock:
+            channel = self._ack_channel
+            max_tag = self._highest_settled_tag
+            backlog, self._ack_backlog = self._ack_backlog, 0
+        if not backlog:
+            return
+        if channel and channel.is_open:
+            channel.basic_ack(delivery_tag=max_tag, multiple=True)
         else:
-            # Channel is already closed, so we can't ACK this message
+            # Channel is already closed, so we can't ACK these messages
             # TODO: handle properly
             pass
 
+    def _periodic_flush(self):
+        """Flush the pending batched acks and re-arm the timer.
+
+        Runs on the connection's I/O thread, so acks settled below the batch
+        threshold are sent within ACK_FLUSH_INTERVAL instead of waiting for
+        the threshold or shutdown.
+        """
+        self._flush_acks()
+        self.rabbit_client.connection.call_later(
+            ACK_FLUSH_INTERVAL, self._periodic_flush
+        )
+
+    def ack_message(self, channel, delivery_tag):
+        with self._ack_lock:
+            self._track_ack_channel(channel)
+            bisect.insort(self._settled_tags, delivery_tag)
+            self._advance_settled_tag()
+            flush = self._ack_backlog >= self._ack_batch_size
+        if flush:
+            self._flush_acks()
+
     def send_ack_message(self, channel, delivery_tag):
-        cb_ack = functools.partial(self.ack_message, channel, delivery_tag)
-        self.rabbit_client.connection.add_callback_threadsafe(cb_ack)
+        self._schedule(functools.partial(self.ack_message, channel, delivery_tag))
 
     def nack_message(self, channel, delivery_tag, requeue=False):
         if channel.is_open:
@@ -62,12 +167,17 @@ class EventListener:
             # Channel is already closed, so we can't NACK this message
             # TODO: handle properly
             pass
+        # The nack settles the tag at the broker, so record it as settled to
+        # keep the contiguous prefix of the batched acks advancing.
+        with self._ack_lock:
+            self._track_ack_channel(channel)
+            bisect.insort(self._settled_tags, delivery_tag)
+            self._advance_settled_tag()
 
     def send_nack_message(self, channel, delivery_tag, requeue=False):
-        cb_nack = functools.partial(
-            self.nack_message, channel, delivery_tag, requeue=requeue
+        self._schedule(
+            functools.partial(self.nack_message, channel, delivery_tag, requeue=requeue)
         )
-        self.rabbit_client.connection.add_callback_threadsafe(cb_nack)
 
     def send_pulsar_message(self, attributes: dict, data: dict) -> Event:
         outgoing_event = Event(attributes, data)
@@ -77,7 +187,7 @@ class EventListener:
     def send_failed_pulsar_message(
         self, attributes: dict, data: dict, message: str
     ) -> Event:
-        data["outcome"] = EventOutcome.FAIL.to_str()
+        data["outcome"] = OUTCOME_FAIL
         data["message"] = message
         outgoing_event = self.send_pulsar_message(attributes, data)
         self.log.info("SIP-creation failed event sent.")
@@ -103,17 +213,19 @@ class EventListener:
         xml_path = message.get_xml_path()
         collaterals_paths = message.get_collateral_paths()
 
-        # Check if essence and XML file exist
-        if not essence_path.exists() or not xml_path.exists():
+        # Check if essence and XML file exist. A single stat per file both
+        # checks the existence and gives us the filesize of the essence.
+        # Essence is moved when creating the bag.
+        try:
+            essence_filesize = essence_path.stat().st_size
+            xml_path.stat()
+        except OSError as e:
             self.log.error(
-                f"Essence ({essence_path}) and/or sidecar ({xml_path}) not found."
+                f"Essence ({essence_path}) and/or sidecar ({xml_path}) not accessible: {e}"
             )
             self.send_nack_message(channel, delivery_tag)
             return
 
-        # filesize of essence. Essence is moved when creating the bag.
-        essence_filesize = essence_path.stat().st_size
-
         # Build Pulsar attributes/data
         attributes = EventAttributes(
             type=PRODUCER_TOPIC,
@@ -123,7 +235,7 @@ class EventListener:
         )
 
         data = {
-            "host": self.config["host"],
+            "host": self._host,
             "essence_filename": essence_path.name,
             "cp_id": message.flow_id,
             "essence_filesize": essence_filesize,
@@ -141,19 +253,39 @@ class EventListener:
             self.send_nack_message(channel, delivery_tag)
             return
 
+        # Check if the supplied md5 is the same as the calculated md5 of the
+        # essence, before running the expensive bag creation
+        md5_hash_essence = md5_file_fast(essence_path)
+        data["md5_hash_essence_sidecar"] = sidecar.md5
+        # Compare the raw 16-byte digests. This also rejects a sidecar md5
+        # that isn't valid hex in the first place.
+        try:
+            md5_match = bytes.fromhex(md5_hash_essence) == bytes.fromhex(sidecar.md5)
+        except ValueError:
+            md5_match = False
+        if not md5_match:
+            self.log.error(
+                "Supplied MD5 differs from the calculated MD5.",
+                sidecar_md5=sidecar.md5,
+                essence_md5=md5_hash_essence,
+            )
+            self.send_failed_pulsar_message(
+                attributes, data, "Supplied MD5 differs from the calculated MD5."
+            )
+            self.send_nack_message(channel, delivery_tag)
+            return
+
         # Create bag
         try:
-            bag_path, bag = Bag(message, sidecar, self.org_api_client).create_sip_bag()
+            bag_path, bag, essence_entry = Bag(
+                message, sidecar, self.org_api_client
+            ).create_sip_bag(precomputed_md5=md5_hash_essence)
         except (ConnectionError, MaxRetryError, RetryError):
             self.send_nack_message(channel, delivery_tag, requeue=True)
             return
 
-        # Regex to match essence paths in bag to fetch md5
-        regex = re.compile("data/representations/.*/data/.*\.(?!srt).*")
-
-        for filepath, fixity in bag.entries.items():
-            if regex.match(filepath):
-                md5_hash_essence_manifest = fixity["md5"]
+        # Fetch the md5 of the essence from the bag manifest
+        md5_hash_essence_manifest = bag.entries[essence_entry]["md5"]
 
         # Add sidecar info to data payload of event
         # Add batch ID if available
@@ -162,36 +294,31 @@ class EventListener:
         # Add local ID if available
         if sidecar.local_id:
             data["local_id"] = sidecar.local_id
-        data["md5_hash_essence_sidecar"] = sidecar.md5
 
         # Add bag info to data payload of event
-        data["path"] = str(bag_path)
+        bag_path_str = str(bag_path)
+        data["path"] = bag_path_str
         data["bag_filesize"] = bag_path.stat().st_size
         data["md5_hash_essence_manifest"] = md5_hash_essence_manifest
 
-        # Check if calculated md5 is the same as the supplied md5
-        if md5_hash_essence_manifest != sidecar.md5.lower():
-            self.log.error(
-                "Supplied MD5 differs from the calculated MD5.",
-                sidecar_md5=sidecar.md5.lower(),
-                manifest_md5=md5_hash_essence_manifest,
-            )
-            self.send_failed_pulsar_message(
-                attributes, data, "Supplied MD5 differs from the calculated MD5."
-            )
-            self.send_nack_message(channel, delivery_tag)
-            return
-
-        data["outcome"] = EventOutcome.SUCCESS.to_str()
-        data["message"] = f"SIP created: '{bag_path}'"
-
-        # Create and send cloudevent
-        self.send_pulsar_message(attributes, data)
+        data["outcome"] = OUTCOME_SUCCESS
+        data["message"] = f"SIP created: '{bag_path_str}'"
+
+        # Create and send cloudevent. The RabbitMQ ack is only sent once the
+        # Pulsar broker has confirmed the event, so the watchfolder message
+        # is never acked before the event is persisted.
+        def on_event_delivered(result, message_id):
+            if result != pulsar.Result.Ok:
+                self.log.error(
+                    f"SIP created event could not be sent: {result}. Requeueing."
+                )
+                self.send_nack_message(channel, delivery_tag, requeue=True)
+                return
+            self.log.info("SIP created event sent.")
+            self.send_ack_message(channel, delivery_tag)
 
-        self.log.info("SIP created event sent.")
-
-        # Send RabbitMQ ack
-        self.send_ack_message(channel, delivery_tag)
+        outgoing_event = Event(attributes, data)
+        self.pulsar_client.produce_event_async(outgoing_event, on_event_delivered)
 
     def handle_message(self, channel, method, properties, body):
         """Main method that will handle the incoming messages.
@@ -200,26 +327,33 @@ class EventListener:
         blocking the RabbitMQ I/O loop, this might result in a heartbeat
         timeout and the rabbit broker closing the connection on its end.
 
-        So, we run the SIP creation in a separate thread making sure the
+        So, we run the SIP creation on a worker pool making sure the
         RabbitMQ I/O loop is not blocked.
 
-        That thread will be appended to a list, in order to be able to wait
-        for all threads to finish in the case consuming is stopped.
+        The pool is bounded by the prefetch count, so bursts of messages
+        can't spawn an unbounded amount of threads.
         """
 
         self.log.debug(f"Incoming message: {body}")
-        # Clean up the list of threads, so it doesn't keep appending
-        for t in self.threads:
-            if not t.is_alive():
-                t.handled = True
-        self.threads = [t for t in self.threads if not t.handled]
-
-        thread = threading.Thread(
-            target=self.do_work, args=(channel, method.delivery_tag, properties, body)
+        future = self._executor.submit(
+            self.do_work, channel, method.delivery_tag, properties, body
+        )
+        future.add_done_callback(
+            functools.partial(self._on_worker_done, channel, method.delivery_tag)
         )
-        thread.handled = False
-        thread.start()
-        self.threads.append(thread)
+
+    def _on_worker_done(self, channel, delivery_tag, future):
+        """Surface unexpected worker failures and settle their delivery tag.
+
+        An exception that escapes do_work would otherwise be swallowed by the
+        discarded Future, leaving its delivery tag unsettled and blocking the
+        batched acks of every later message behind the contiguity gate.
+        """
+        e = future.exception()
+        if e is None:
+            return
+        self.log.error(f"SIP creation failed unexpectedly: {e!r}")
+        self.send_nack_message(channel, delivery_tag)
 
     def exit_gracefully(self, signum, frame):
         """Stop consuming queue but finish current tasks/messages."""
@@ -232,12 +366,16 @@ class EventListener:
         # Start listening for incoming messages
         self.log.info("Start to listen for messages...")
         self.rabbit_client.listen(self.handle_message)
-        # Wait for remaining threads to join after consuming.
-        for thread in self.threads:
-            thread.join()
+        # Wait for remaining workers to finish after consuming.
+        self._executor.shutdown(wait=True)
+        # Drain the in-flight Pulsar events: their delivery callbacks schedule
+        # the acks, so they must run while the connection is still open.
+        self.pulsar_client.flush()
+        # Ensure the remaining batched acks are sent before closing
+        self._schedule(self._flush_acks)
         # Ensure callback (n)acks are send
         self.rabbit_client.connection.process_data_events()
 
+        self.pulsar_client.close()
         # Close the RabbitMQ connection
         self.rabbit_client.connection.close()
-        self.pulsar_client.close()
@@ -2,9 +2,16 @@
 # -*- coding: utf-8 -*-
 
 import hashlib
+import os
 import shutil
+import subprocess
+import sys
 import zipfile
-from datetime import datetime
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import date, datetime
 from pathlib import Path
 
 import bagit
@@ -129,6 +136,24 @@ MIMETYPE_TYPE_MAP = {
 }
 
 
+# Casefolded, read-only copy of the extension map, so lookups don't need to
+# normalise the map keys per call. Keys and values are interned: the returned
+# mimetypes are compared and hashed again downstream, and interned strings
+# compare by pointer.
+_EXTENSION_MIMETYPE_MAP_CF = MappingProxyType(
+    {
+        sys.intern(extension.casefold()): sys.intern(mimetype)
+        for extension, mimetype in EXTENSION_MIMETYPE_MAP.items()
+    }
+)
+
+_MIMETYPE_TYPE_MAP_GET = MappingProxyType(MIMETYPE_TYPE_MAP).get
+
+
+# Bounded cache: paths are mostly unique across SIPs, so don't keep them
+# around forever, but repeated lookups for the same file within one SIP hit
+# the cache.
+@lru_cache(maxsize=1024)
 def guess_mimetype(file: Path) -> str | None:
     """Calculate the mimetype of a path based on the extension.
 
@@ -138,12 +163,12 @@ def guess_mimetype(file: Path) -> str | None:
     Returns:
         The mimetype.
     """
-    try:
-        return EXTENSION_MIMETYPE_MAP[file.suffix.lower()]
-    except KeyError:
-        return None
+    # Misses are expected (unknown extensions), so a .get beats raising
+    # and catching a KeyError.
+    return _EXTENSION_MIMETYPE_MAP_CF.get(file.suffix.casefold())
 
 
+@lru_cache(maxsize=None)
 def calculate_sip_type(mimetype: str) -> str:
     """Calculate the type of the SIP based on the mimetype of the essence.
 
@@ -153,29 +178,177 @@ def calculate_sip_type(mimetype: str) -> str:
     Returns:
         The type of the SIP.
     """
-    try:
-        return MIMETYPE_TYPE_MAP[mimetype]
-    except KeyError:
-        return "OTHER"
+    return _MIMETYPE_TYPE_MAP_GET(mimetype, "OTHER")
+
+
+# Chunk size used when reading files for copying and/or hashing
+CHUNK_SIZE = 1024 * 1024
+
+# Relative locations of the metadata files inside the SIP, precomputed as
+# plain strings so the METS builders don't rebuild Path objects per SIP
+DESC_IE_PATH_REL = "metadata/descriptive/dc.xml"
+PRES_IE_PATH_REL = "metadata/preservation/premis.xml"
+REPRESENTATION_PATH_REL = "representations/representation_1"
+REP_METS_PATH_REL = f"{REPRESENTATION_PATH_REL}/mets.xml"
+REP_PRES_PATH_REL = f"{REPRESENTATION_PATH_REL}/metadata/preservation/premis.xml"
+
+
+def _new_md5():
+    """Construct an md5 meant for fixity, not security.
+
+    usedforsecurity=False lets OpenSSL skip the FIPS wrapping and always
+    take its fast md5 code path.
+    """
+    return hashlib.md5(usedforsecurity=False)
+
+
+def walk(root: Path):
+    """Yield the directory entries under a root folder, depth-first.
+
+    os.scandir carries the type information in its entries, so the
+    traversal doesn't stat every path again like Path.rglob does.
+
+    Args:
+        root: The folder to walk.
+
+    Yields:
+        The os.DirEntry objects of all files and folders under the root.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
 
 
 def md5(file: Path) -> str:
     """Calculate the md5 of a given file.
 
+    Reads in 1 MiB chunks into a reusable buffer: tiny read sizes make the
+    hashing I/O-bound on Python-level call overhead instead of on the disk.
+    Uses the zero-copy hashlib.file_digest on Python 3.11+.
+
     Args:
         File to calculate the md5 for.
 
     Returns:
         The md5 value in hex value.
     """
-    hash_md5 = hashlib.md5()
-    with open(file, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
+    with open(file, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, _new_md5, _bufsize=CHUNK_SIZE).hexdigest()
+        hash_md5 = _new_md5()
+        buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
+        while chunk_size := f.readinto(buffer):
+            hash_md5.update(view[:chunk_size])
+        return hash_md5.hexdigest()
+
+
+def md5_file_fast(file: Path) -> str:
+    """Calculate the md5 of a given file via the native `md5sum` binary.
+
+    The coreutils binary hashes large files considerably faster than a
+    Python-level chunk loop as it uses SIMD-accelerated primitives. Falls
+    back to the chunked hashlib implementation when the binary is not
+    available.
+
+    Args:
+        File to calculate the md5 for.
+
+    Returns:
+        The md5 value in hex value.
+    """
+    # The file is passed on stdin: md5sum escapes filenames containing
+    # backslashes or newlines and prefixes the output with '\', which would
+    # corrupt the parsed digest. With stdin the output is always '<hex>  -'.
+    try:
+        with open(file, "rb") as f:
+            result = subprocess.run(
+                ["md5sum"], stdin=f, capture_output=True, check=True
+            )
+        return result.stdout.split()[0].decode()
+    except (OSError, subprocess.CalledProcessError, IndexError):
+        return md5(file)
+
+
+def fast_copy(source: Path, destination: Path):
+    """Copy a file in-kernel when possible.
+
+    os.copy_file_range moves the data without round-tripping it through
+    userspace buffers, and reflinks on file systems that support it. Falls
+    back to a chunked userspace copy where the syscall is not supported
+    (e.g. copies across certain file systems on older kernels). The
+    fallback continues from the current file offsets, so bytes already
+    copied in-kernel are not copied twice.
+
+    Args:
+        source: The file to copy.
+        destination: The path to copy the file to.
+    """
+    with open(source, "rb") as src, open(destination, "wb") as dest:
+        try:
+            while os.copy_file_range(src.fileno(), dest.fileno(), 1 << 30):
+                pass
+        except OSError:
+            shutil.copyfileobj(src, dest, length=CHUNK_SIZE)
+
+
+def copy_and_md5(source: Path, destination: Path) -> str:
+    """Copy a file and calculate its md5 in a single read pass.
+
+    Reading the file once for copying and once for hashing doubles the disk
+    bandwidth on multi-GB essences. Instead, feed every chunk read to both
+    the destination file and the hash.
+
+    Args:
+        source: The file to copy.
+        destination: The path to copy the file to.
+
+    Returns:
+        The md5 value in hex value.
+    """
+    hash_md5 = _new_md5()
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(source, "rb", buffering=0) as src, open(
+        destination, "wb", buffering=0
+    ) as dest:
+        while chunk_size := src.readinto(buffer):
+            hash_md5.update(view[:chunk_size])
+            dest.write(view[:chunk_size])
     return hash_md5.hexdigest()
 
 
+@dataclass
+class FileInfo:
+    """The metadata of a file in the SIP, probed in one go.
+
+    Args:
+        size: The size of the file in bytes.
+        created: The creation time of the file.
+        md5: The md5 value in hex value.
+        mimetype: The mimetype of the file.
+    """
+
+    size: int
+    created: datetime
+    md5: str
+    mimetype: str | None
+
+
 class Bag:
+    __slots__ = (
+        "watchfolder_message",
+        "sidecar",
+        "org_api_client",
+        "essence_md5",
+        "_md5_cache",
+        "_probe_cache",
+    )
+
     def __init__(
         self,
         watchfolder_message: WatchfolderMessage,
@@ -185,6 +358,56 @@ class Bag:
         self.watchfolder_message: WatchfolderMessage = watchfolder_message
         self.sidecar: Sidecar = sidecar
         self.org_api_client: OrgApiClient = org_api_client
+        # The md5 of the essence, calculated while copying it into the bag
+        self.essence_md5: str | None = None
+        # Memoized md5s of the files in the SIP, keyed by path
+        self._md5_cache: dict[Path, str] = {}
+        # Memoized file metadata, keyed by path
+        self._probe_cache: dict[Path, FileInfo] = {}
+
+    def _probe(self, file: Path) -> FileInfo:
+        """Collect the size, creation time, md5 and mimetype of a file.
+
+        Does a single os.stat per file instead of one syscall per attribute,
+        and goes through the memoized md5. The result is cached, so the
+        package and representation METS builders don't re-probe shared files.
+
+        Args:
+            The file to probe.
+
+        Returns:
+            The file metadata.
+        """
+        info = self._probe_cache.get(file)
+        if info is None:
+            stat = file.stat()
+            info = FileInfo(
+                size=stat.st_size,
+                # Built once per file: datetime.fromtimestamp is heavier
+                # than it looks (timezone lookup per call) and the probe
+                # result is reused by several METS entries
+                created=datetime.fromtimestamp(stat.st_ctime),
+                md5=self._md5(file),
+                mimetype=guess_mimetype(file),
+            )
+            self._probe_cache[file] = info
+        return info
+
+    def _md5(self, file: Path) -> str:
+        """Calculate the md5 of a file, memoized per path.
+
+        The same file can be referenced by the METS file section, the PREMIS
+        fixity and the bag manifest, so it is hashed only once per bag.
+
+        Args:
+            File to calculate the md5 for.
+
+        Returns:
+            The md5 value in hex value.
+        """
+        if file not in self._md5_cache:
+            self._md5_cache[file] = md5(file)
+        return self._md5_cache[file]
 
     def _create_package_mets(self, sip_root_folder: Path):
         """Create the package METS.
@@ -247,38 +470,33 @@ class Bag:
         )
 
         # The descriptive metadata on IE level
-        desc_ie_path_rel = Path("metadata", "descriptive", "dc.xml")
-        desc_ie_path = Path(sip_root_folder, desc_ie_path_rel)
+        desc_ie_path = sip_root_folder.joinpath(DESC_IE_PATH_REL)
+        desc_ie_info = self._probe(desc_ie_path)
         desc_ie_file = File(
             file_type=FileType.FILE,
             label="descriptive",
-            checksum=md5(desc_ie_path),
-            size=desc_ie_path.stat().st_size,
-            mimetype=guess_mimetype(desc_ie_path),
-            created=datetime.fromtimestamp(desc_ie_path.stat().st_ctime),
-            path=str(desc_ie_path_rel),
+            checksum=desc_ie_info.md5,
+            size=desc_ie_info.size,
+            mimetype=desc_ie_info.mimetype,
+            created=desc_ie_info.created,
+            path=DESC_IE_PATH_REL,
         )
         metadata_desc_folder.add_child(desc_ie_file)
 
         # The preservation metadata on IE level
-        pres_ie_path_rel = Path("metadata", "preservation", "premis.xml")
-        pres_ie_path = Path(sip_root_folder, pres_ie_path_rel)
+        pres_ie_path = sip_root_folder.joinpath(PRES_IE_PATH_REL)
+        pres_ie_info = self._probe(pres_ie_path)
         pres_ie_file = File(
             file_type=FileType.FILE,
             label="preservation",
-            checksum=md5(pres_ie_path),
-            size=pres_ie_path.stat().st_size,
-            mimetype=guess_mimetype(pres_ie_path),
-            created=datetime.fromtimestamp(pres_ie_path.stat().st_ctime),
-            path=str(pres_ie_path_rel),
+            checksum=pres_ie_info.md5,
+            size=pres_ie_info.size,
+            mimetype=pres_ie_info.mimetype,
+            created=pres_ie_info.created,
+            path=PRES_IE_PATH_REL,
         )
         metadata_pres_folder.add_child(pres_ie_file)
 
-        metadata_preserv_folder = File(
-            file_type=FileType.DIRECTORY,
-            use=f"{FileGrpUse.METADATA.value}/{FileGrpUse.PRESERVATION.value}",
-            label=FileGrpUse.PRESERVATION.value,
-        )
         reps_folder = File(
             file_type=FileType.DIRECTORY,
             use=FileGrpUse.REPRESENTATIONS.value,
@@ -291,16 +509,16 @@ class Bag:
         )
 
         # The representation METS File used for fileSec and structMap
-        reps_path_rel = Path("representations", "representation_1", "mets.xml")
-        reps_path = Path(sip_root_folder, reps_path_rel)
+        reps_path = sip_root_folder.joinpath(REP_METS_PATH_REL)
+        reps_info = self._probe(reps_path)
         reps_file = File(
             file_type=FileType.FILE,
             label="representation_1",
-            checksum=md5(reps_path),
-            size=reps_path.stat().st_size,
-            mimetype=guess_mimetype(reps_path),
-            created=datetime.fromtimestamp(reps_path.stat().st_ctime),
-            path=str(reps_path_rel),
+            checksum=reps_info.md5,
+            size=reps_info.size,
+            mimetype=reps_info.mimetype,
+            created=reps_info.created,
+            path=REP_METS_PATH_REL,
             is_mets=True,
         )
         reps_folder_1.add_child(reps_file)
@@ -308,7 +526,7 @@ class Bag:
         reps_folder.add_child(reps_folder_1)
 
         metadata_folder.add_child(metadata_desc_folder)
-        metadata_folder.add_child(metadata_preserv_folder)
+        metadata_folder.add_child(metadata_pres_folder)
 
         root_folder.add_child(metadata_folder)
         root_folder.add_child(reps_folder)
@@ -363,55 +581,53 @@ class Bag:
             label=FileGrpUse.DATA.value,
         )
 
-        representation_path = Path("representations", "representation_1")
-
         # The preservation metadata file used for fileSec and structMap
-        pres_path_rel = Path(
-            representation_path, "metadata", "preservation", "premis.xml"
-        )
-        pres_path = Path(sip_root_folder, pres_path_rel)
+        pres_path = sip_root_folder.joinpath(REP_PRES_PATH_REL)
+        pres_info = self._probe(pres_path)
         pres_file = File(
             file_type=FileType.FILE,
             use=FileGrpUse.PRESERVATION.value,
             label=FileGrpUse.PRESERVATION.value,
-            mimetype=guess_mimetype(pres_path),
-            path=str(pres_path_rel),
-            size=pres_path.stat().st_size,
-            checksum=md5(pres_path),
-            created=datetime.fromtimestamp(pres_path.stat().st_ctime),
+            mimetype=pres_info.mimetype,
+            path=REP_PRES_PATH_REL,
+            size=pres_info.size,
+            checksum=pres_info.md5,
+            created=pres_info.created,
         )
         metadata_preserv_folder.add_child(pres_file)
 
         # The essence file used for fileSec and structMap
-        data_path_rel = Path(representation_path, "data", essence_file_name)
-        data_path = Path(sip_root_folder, data_path_rel)
+        data_path_rel = f"{REPRESENTATION_PATH_REL}/data/{essence_file_name}"
+        data_path = sip_root_folder.joinpath(data_path_rel)
+        data_info = self._probe(data_path)
         data_file = File(
             file_type=FileType.FILE,
             use=FileGrpUse.DATA.value,
             label=FileGrpUse.DATA.value,
-            mimetype=guess_mimetype(data_path),
-            path=str(data_path_rel),
-            size=data_path.stat().st_size,
+            mimetype=data_info.mimetype,
+            path=data_path_rel,
+            size=data_info.size,
             checksum=self.sidecar.md5,
-            created=datetime.fromtimestamp(data_path.stat().st_ctime),
+            created=data_info.created,
         )
         data_folder.add_child(data_file)
 
         # The collateral files used for fileSec and structMap
         for collaterals_file_name in collaterals_file_names:
-            collateral_path_rel = Path(
-                representation_path, "data", collaterals_file_name
+            collateral_path_rel = (
+                f"{REPRESENTATION_PATH_REL}/data/{collaterals_file_name}"
             )
-            collateral_path = Path(sip_root_folder, collateral_path_rel)
+            collateral_path = sip_root_folder.joinpath(collateral_path_rel)
+            collateral_info = self._probe(collateral_path)
             collateral_file = File(
                 file_type=FileType.FILE,
                 use=FileGrpUse.DATA.value,
                 label=FileGrpUse.DATA.value,
-                mimetype=guess_mimetype(collateral_path),
+                mimetype=collateral_info.mimetype,
                 path=str(collateral_path),
-                size=collateral_path.stat().st_size,
-                checksum=md5(collateral_path),
-                created=datetime.fromtimestamp(collateral_path.stat().st_ctime),
+                size=collateral_info.size,
+                checksum=collateral_info.md5,
+                created=collateral_info.created,
             )
             data_folder.add_child(collateral_file)
 
@@ -434,7 +650,6 @@ class Bag:
         )
         etree.ElementTree(dc_terms).write(
             str(folder.joinpath("dc.xml")),
-            pretty_print=True,
             encoding="utf-8",
         )
 
@@ -596,11 +811,9 @@ class Bag:
                 )
                 premis_object_element_rep.add_significant_properties(brand_element)
 
-        # Write preservation data on IE level.
-        etree.ElementTree(premis_element.to_element()).write(
-            str(folder.joinpath("premis.xml")),
-            pretty_print=True,
-        )
+        # Write preservation data on IE level, streamed subtree by subtree.
+        with open(folder.joinpath("premis.xml"), "wb") as f:
+            premis_element.write_xml(f)
 
     def _write_preservation_metadata_representation(
         self,
@@ -676,7 +889,7 @@ class Bag:
                 ObjectType.FILE,
                 [ObjectIdentifier("uuid", uuid)],
                 original_name=OriginalName(path.name),
-                fixity=Fixity(md5(path)),
+                fixity=Fixity(self._md5(path)),
             )
             # Premis object collateral relationship with its representation
             premis_object_element_collateral_relation_rep = Relationship(
@@ -696,12 +909,71 @@ class Bag:
 
             premis_element.add_object(premis_object_element_collateral)
 
-        etree.ElementTree(premis_element.to_element()).write(
-            str(folder.joinpath("premis.xml")),
-            pretty_print=True,
-        )
+        with open(folder.joinpath("premis.xml"), "wb") as f:
+            premis_element.write_xml(f)
+
+    def _make_bag(self, root_folder: Path, bag_info: dict) -> bagit.Bag:
+        """Turn the SIP folder into a bag, reusing the cached payload md5s.
+
+        bagit.make_bag reads and hashes every payload file again, including
+        the multi-GB essence that was already hashed while copying it into
+        the SIP. Instead, write the bag structure here: collect the payload
+        manifest from the memoized digests, move the payload under data/ and
+        only hash the small tag files.
 
-    def create_sip_bag(self) -> tuple[Path, bagit.Bag]:
+        Args:
+            root_folder: The root folder of the SIP.
+            bag_info: The metadata for bag-info.txt.
+
+        Returns:
+            The bag, loaded from disk.
+        """
+        # Collect the payload manifest and oxum before the move, as the
+        # digests are memoized under the pre-move paths
+        payload_entries: list[tuple[str, str]] = []
+        total_bytes = 0
+        total_files = 0
+        root_folder_str = str(root_folder)
+        for entry in walk(root_folder):
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            relpath = os.path.relpath(entry.path, root_folder_str)
+            payload_entries.append((f"data/{relpath}", self._md5(Path(entry.path))))
+            total_bytes += entry.stat(follow_symlinks=False).st_size
+            total_files += 1
+
+        # Move the payload under data/
+        payload_names = os.listdir(root_folder)
+        data_folder = root_folder.joinpath("data")
+        data_folder.mkdir()
+        for name in payload_names:
+            shutil.move(
+                str(root_folder.joinpath(name)), str(data_folder.joinpath(name))
+            )
+
+        bag_info.setdefault("Bagging-Date", date.today().isoformat())
+        bag_info.setdefault("Payload-Oxum", f"{total_bytes}.{total_files}")
+
+        # Write the tag files
+        with open(root_folder.joinpath("bagit.txt"), "w", encoding="utf-8") as f:
+            f.write("BagIt-Version: 0.97\nTag-File-Character-Encoding: UTF-8\n")
+        with open(root_folder.joinpath("manifest-md5.txt"), "w", encoding="utf-8") as f:
+            for path, digest in sorted(payload_entries):
+                f.write(f"{digest}  {path}\n")
+        with open(root_folder.joinpath("bag-info.txt"), "w", encoding="utf-8") as f:
+            for key, value in bag_info.items():
+                f.write(f"{key}: {value}\n")
+        with open(
+            root_folder.joinpath("tagmanifest-md5.txt"), "w", encoding="utf-8"
+        ) as f:
+            for name in ("bag-info.txt", "bagit.txt", "manifest-md5.txt"):
+                f.write(f"{md5(root_folder.joinpath(name))}  {name}\n")
+
+        return bagit.Bag(str(root_folder))
+
+    def create_sip_bag(
+        self, precomputed_md5: str | None = None
+    ) -> tuple[Path, bagit.Bag, str]:
         """Create the SIP in the bag format.
 
         - Create the minimal SIP
@@ -726,9 +998,12 @@ class Bag:
                         premis.xml
 
         Args:
-            watchfolder_message: The parse watchfolder message.
+            precomputed_md5: The md5 of the essence, if already calculated by
+                the caller. Passing it skips hashing the essence during the
+                copy into the bag.
         Returns:
-            The path of the zipped bag and the bag information.
+            The path of the zipped bag, the bag information and the path of
+            the essence in the bag manifest.
         """
         essence_path: Path = self.watchfolder_message.get_essence_path()
         xml_path: Path = self.watchfolder_message.get_xml_path()
@@ -776,17 +1051,33 @@ class Bag:
         # /representations/representation_1/data/
         representations_data_folder = representations_folder.joinpath("data")
         representations_data_folder.mkdir(exist_ok=True)
-        # Copy essence
-        shutil.copy(
-            essence_path, representations_data_folder.joinpath(essence_path.name)
-        )
-
-        # Copy collaterals
-        for collateral_path in collateral_paths:
-            shutil.copy(
-                collateral_path,
-                representations_data_folder.joinpath(collateral_path.name),
-            )
+        # Copy essence and calculate its md5 in the same pass, unless the
+        # caller already calculated it
+        essence_dest = representations_data_folder.joinpath(essence_path.name)
+        if precomputed_md5:
+            fast_copy(essence_path, essence_dest)
+            self.essence_md5 = precomputed_md5
+        else:
+            self.essence_md5 = copy_and_md5(essence_path, essence_dest)
+        self._md5_cache[essence_path] = self.essence_md5
+        self._md5_cache[essence_dest] = self.essence_md5
+
+        # Copy collaterals. Each collateral is copied and hashed in a single
+        # pass, and the digest is seeded in the cache for both paths, so
+        # neither is hashed again by the METS/PREMIS builders. The copies run
+        # concurrently: md5 releases the GIL, so I/O and hashing overlap.
+        def copy_collateral(collateral_path: Path):
+            collateral_dest = representations_data_folder.joinpath(collateral_path.name)
+            digest = copy_and_md5(collateral_path, collateral_dest)
+            self._md5_cache[collateral_path] = digest
+            self._md5_cache[collateral_dest] = digest
+
+        if collateral_paths:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(collateral_paths))
+            ) as executor:
+                # Consume the iterator so worker exceptions propagate
+                list(executor.map(copy_collateral, collateral_paths))
 
         # representations/representation_1/metadata/
         representations_metadata_folder = representations_folder.joinpath("metadata")
@@ -816,13 +1107,13 @@ class Bag:
         # Create and write representation mets.xml
         representation_mets_element = self._create_representation_mets(root_folder)
         etree.ElementTree(representation_mets_element).write(
-            str(representations_folder.joinpath("mets.xml")), pretty_print=True
+            str(representations_folder.joinpath("mets.xml"))
         )
 
         # Create and write package mets.xml
         package_mets_element = self._create_package_mets(root_folder)
         etree.ElementTree(package_mets_element).write(
-            str(root_folder.joinpath("mets.xml")), pretty_print=True
+            str(root_folder.joinpath("mets.xml"))
         )
 
         # Bag
@@ -833,16 +1124,35 @@ class Bag:
         if self.sidecar.sp_name == "TAPE":
             bag_info["Meemoo-Workflow"] = self.sidecar.sp_name
 
-        # Make bag
-        bag = bagit.make_bag(root_folder, bag_info=bag_info, checksums=["md5"])
+        # Make bag, reusing the digests calculated while building the SIP
+        bag = self._make_bag(root_folder, bag_info)
 
-        # Zip bag
+        # Zip bag. The payload is mostly already-compressed audiovisual data,
+        # so entries are stored uncompressed and streamed through a 1 MiB
+        # buffer instead of zipfile's small default.
         bag_path = Path(f"{root_folder}.bag.zip")
-        with zipfile.ZipFile(bag_path, mode="w") as archive:
-            for file_path in root_folder.rglob("*"):
-                archive.write(file_path, arcname=file_path.relative_to(root_folder))
+        root_folder_str = str(root_folder)
+        with zipfile.ZipFile(
+            bag_path, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True
+        ) as archive:
+            for entry in walk(root_folder):
+                arcname = os.path.relpath(entry.path, root_folder_str)
+                if entry.is_dir(follow_symlinks=False):
+                    archive.write(entry.path, arcname=arcname)
+                    continue
+                zip_info = zipfile.ZipInfo.from_file(entry.path, arcname)
+                with open(entry.path, "rb") as src, archive.open(
+                    zip_info, mode="w", force_zip64=True
+                ) as dest:
+                    shutil.copyfileobj(src, dest, length=CHUNK_SIZE)
 
         # Remove root folder
         shutil.rmtree(root_folder)
 
-        return Path(bag_path), bag
+        # The path of the essence in the bag manifest. Bagit prefixes the
+        # payload entries with "data/".
+        essence_entry = (
+            f"data/representations/representation_1/data/{essence_path.name}"
+        )
+
+        return Path(bag_path), bag, essence_entry
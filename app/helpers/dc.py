@@ -1,14 +1,35 @@
+import threading
 from pathlib import Path
 
 from lxml import etree
 
+# Reused parser for the source documents. They are small and flat, so skip
+# collecting xml:id attributes. Transforms run on the worker pool and lxml
+# parsers must not be shared between threads concurrently, so each thread
+# gets its own instance.
+_LOCAL = threading.local()
+
+
+def _parser() -> etree.XMLParser:
+    try:
+        return _LOCAL.parser
+    except AttributeError:
+        _LOCAL.parser = etree.XMLParser(collect_ids=False)
+        return _LOCAL.parser
+
 
 class DC:
     """Class to write descriptive metadata of the representation in DC(Terms) format."""
 
+    # The compiled XSLT, shared by all transforms. Compiling a stylesheet is
+    # expensive; applying it is cheap and thread-safe.
+    _transform: etree.XSLT | None = None
+
     @classmethod
     def transform(cls, xml_source_path: Path, **kwargs) -> etree.Element:
-        xslt_path = Path("app", "resources", "dc.xslt")
-        xslt = etree.parse(str(xslt_path.resolve()))
-        transform = etree.XSLT(xslt)
-        return transform(etree.parse(str(xml_source_path)), **kwargs).getroot()
+        if cls._transform is None:
+            xslt_path = Path("app", "resources", "dc.xslt")
+            cls._transform = etree.XSLT(etree.parse(str(xslt_path.resolve())))
+        return cls._transform(
+            etree.parse(str(xml_source_path), _parser()), **kwargs
+        ).getroot()
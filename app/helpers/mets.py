@@ -429,8 +429,11 @@ class METSDocSIP:
             attrib=attrs,
         )
 
-    def _document_hdr(self):
-        """Returns the metsHdr node as an lxml element.
+    def _document_hdr(self, root):
+        """Builds the metsHdr node directly under the document root.
+
+        Args:
+            root: The METS root element.
 
         Returns:
             The metsHdr element."""
@@ -440,28 +443,34 @@ class METSDocSIP:
         }
         if self.is_package_mets:
             hdr_attrs[qname_text(NAMESPACES, "csip", "OAISPACKAGETYPE")] = "SIP"
-        hdr_element = etree.Element(hdr_tag, **hdr_attrs)
+        hdr_element = etree.SubElement(root, hdr_tag, **hdr_attrs)
         for agent in self.agents:
             hdr_element.append(agent.to_element())
         return hdr_element
 
-    def _filesec(self):
-        """Returns fileSec node for all files as an lxml element.
+    def _filesec(self, root):
+        """Builds the fileSec node for all files directly under the root.
+
+        Args:
+            root: The METS root element.
 
         Returns:
             The fileSec element."""
-        filesec_element = etree.Element(self.FILESEC_TAG, ID=generate_uuid())
+        filesec_element = etree.SubElement(root, self.FILESEC_TAG, ID=generate_uuid())
         for file in self.files:
             filesec_element.append(file.to_filesec_element())
         return filesec_element
 
-    def _structmap(self):
-        """Returns structMap node for all files as an lxml element.
+    def _structmap(self, root):
+        """Builds the structMap node for all files directly under the root.
+
+        Args:
+            root: The METS root element.
 
         Returns:
             The structMap element."""
         structmap_attrs = {"ID": generate_uuid(), "TYPE": "PHYSICAL", "LABEL": "CSIP"}
-        structmap_element = etree.Element(self.STRUCTMAP_TAG, structmap_attrs)
+        structmap_element = etree.SubElement(root, self.STRUCTMAP_TAG, structmap_attrs)
         for file in self.files:
             structmap_element.append(file.to_structmap_element())
         return structmap_element
@@ -482,24 +491,30 @@ class METSDocSIP:
         """
         self.amdsec.append(file)
 
-    def _dmdSec(self):
-        """Returns dmdSec node including all dmdSec files as an lxml element.
+    def _dmdSec(self, root):
+        """Builds the dmdSec node including all dmdSec files under the root.
+
+        Args:
+            root: The METS root element.
 
         Returns:
             The dmdSec element."""
         dmdsec_attrs = {"ID": generate_uuid()}
-        dmdsec_element = etree.Element(self.DMDSEC_TAG, dmdsec_attrs)
+        dmdsec_element = etree.SubElement(root, self.DMDSEC_TAG, dmdsec_attrs)
         for file in self.dmdsec:
             dmdsec_element.append(file.to_dmdsec_element())
         return dmdsec_element
 
-    def _amdSec(self):
-        """Returns amdSec node including all amdSec files as an lxml element.
+    def _amdSec(self, root):
+        """Builds the amdSec node including all amdSec files under the root.
+
+        Args:
+            root: The METS root element.
 
         Returns:
             The amdSec element."""
         amdsec_attrs = {"ID": generate_uuid()}
-        amdsec_element = etree.Element(self.AMDSEC_TAG, amdsec_attrs)
+        amdsec_element = etree.SubElement(root, self.AMDSEC_TAG, amdsec_attrs)
         for file in self.amdsec:
             amdsec_element.append(file.to_amdsec_element())
         return amdsec_element
@@ -523,16 +538,19 @@ class METSDocSIP:
     def to_element(self):
         """Returns the METS document as an lxml element.
 
+        The sections are built in place as subelements of the root, so no
+        separately built trees need to be reparented afterwards.
+
         Returns:
             The METS document."""
         root = self._document_root()
         # Add metsHdr
-        root.append(self._document_hdr())
+        self._document_hdr(root)
         # Add dmdSec and amdSec
-        root.append(self._dmdSec())
-        root.append(self._amdSec())
+        self._dmdSec(root)
+        self._amdSec(root)
         # Add files: fileSec and StructMap
-        root.append(self._filesec())
-        root.append(self._structmap())
+        self._filesec(root)
+        self._structmap(root)
 
         return root
@@ -14,6 +14,82 @@ NSMAP = {
     "schema": "http://schema.org/",
 }
 
+# Fully qualified tag names used by the builders below, computed once at
+# import time instead of once per created element
+_PREMIS_ORIGINAL_NAME = qname_text(NSMAP, "premis", "originalName")
+_PREMIS_OBJECT_IDENTIFIER = qname_text(NSMAP, "premis", "objectIdentifier")
+_PREMIS_OBJECT_IDENTIFIER_TYPE = qname_text(NSMAP, "premis", "objectIdentifierType")
+_PREMIS_OBJECT_IDENTIFIER_VALUE = qname_text(NSMAP, "premis", "objectIdentifierValue")
+_PREMIS_RELATED_OBJECT_IDENTIFIER = qname_text(
+    NSMAP, "premis", "relatedObjectIdentifier"
+)
+_PREMIS_RELATED_OBJECT_IDENTIFIER_TYPE = qname_text(
+    NSMAP, "premis", "relatedObjectIdentifierType"
+)
+_PREMIS_RELATED_OBJECT_IDENTIFIER_VALUE = qname_text(
+    NSMAP, "premis", "relatedObjectIdentifierValue"
+)
+_PREMIS_RELATIONSHIP = qname_text(NSMAP, "premis", "relationship")
+_PREMIS_RELATIONSHIP_TYPE = qname_text(NSMAP, "premis", "relationshipType")
+_PREMIS_RELATIONSHIP_SUBTYPE = qname_text(NSMAP, "premis", "relationshipSubtype")
+_PREMIS_OBJECT_CHARACTERISTICS = qname_text(NSMAP, "premis", "objectCharacteristics")
+_PREMIS_FIXITY = qname_text(NSMAP, "premis", "fixity")
+_PREMIS_MESSAGE_DIGEST_ALGORITHM = qname_text(NSMAP, "premis", "messageDigestAlgorithm")
+_PREMIS_MESSAGE_DIGEST = qname_text(NSMAP, "premis", "messageDigest")
+_PREMIS_OBJECT_CATEGORY = qname_text(NSMAP, "premis", "objectCategory")
+_PREMIS_STORAGE = qname_text(NSMAP, "premis", "storage")
+_PREMIS_STORAGE_MEDIUM = qname_text(NSMAP, "premis", "storageMedium")
+_PREMIS_SIGNIFICANT_PROPERTIES_EXTENSION = qname_text(
+    NSMAP, "premis", "significantPropertiesExtension"
+)
+_SCHEMA_BRAND = qname_text(NSMAP, "schema", "brand")
+_SCHEMA_NAME = qname_text(NSMAP, "schema", "name")
+_PREMIS_SIGNIFICANT_PROPERTIES = qname_text(NSMAP, "premis", "significantProperties")
+_PREMIS_SIGNIFICANT_PROPERTIES_TYPE = qname_text(
+    NSMAP, "premis", "significantPropertiesType"
+)
+_PREMIS_SIGNIFICANT_PROPERTIES_VALUE = qname_text(
+    NSMAP, "premis", "significantPropertiesValue"
+)
+_XSI_TYPE = qname_text(NSMAP, "xsi", "type")
+_PREMIS_OBJECT = qname_text(NSMAP, "premis", "object")
+_PREMIS_AGENT_IDENTIFIER = qname_text(NSMAP, "premis", "agentIdentifier")
+_PREMIS_AGENT_IDENTIFIER_TYPE = qname_text(NSMAP, "premis", "agentIdentifierType")
+_PREMIS_AGENT_IDENTIFIER_VALUE = qname_text(NSMAP, "premis", "agentIdentifierValue")
+_PREMIS_AGENT_EXTENSION = qname_text(NSMAP, "premis", "agentExtension")
+_SCHEMA_MODEL = qname_text(NSMAP, "schema", "model")
+_SCHEMA_SERIAL_NUMBER = qname_text(NSMAP, "schema", "serialNumber")
+_PREMIS_AGENT = qname_text(NSMAP, "premis", "agent")
+_PREMIS_AGENT_NAME = qname_text(NSMAP, "premis", "agentName")
+_PREMIS_AGENT_TYPE = qname_text(NSMAP, "premis", "agentType")
+_PREMIS_LINKING_AGENT_ROLE = qname_text(NSMAP, "premis", "linkingAgentRole")
+_PREMIS_LINKING_AGENT_IDENTIFIER = qname_text(NSMAP, "premis", "linkingAgentIdentifier")
+_PREMIS_LINKING_AGENT_IDENTIFIER_TYPE = qname_text(
+    NSMAP, "premis", "linkingAgentIdentifierType"
+)
+_PREMIS_LINKING_AGENT_IDENTIFIER_VALUE = qname_text(
+    NSMAP, "premis", "linkingAgentIdentifierValue"
+)
+_PREMIS_LINKING_OBJECT_ROLE = qname_text(NSMAP, "premis", "linkingObjectRole")
+_PREMIS_LINKING_OBJECT_IDENTIFIER = qname_text(
+    NSMAP, "premis", "linkingObjectIdentifier"
+)
+_PREMIS_LINKING_OBJECT_IDENTIFIER_TYPE = qname_text(
+    NSMAP, "premis", "linkingObjectIdentifierType"
+)
+_PREMIS_LINKING_OBJECT_IDENTIFIER_VALUE = qname_text(
+    NSMAP, "premis", "linkingObjectIdentifierValue"
+)
+_PREMIS_EVENT_IDENTIFIER = qname_text(NSMAP, "premis", "eventIdentifier")
+_PREMIS_EVENT_IDENTIFIER_TYPE = qname_text(NSMAP, "premis", "eventIdentifierType")
+_PREMIS_EVENT_IDENTIFIER_VALUE = qname_text(NSMAP, "premis", "eventIdentifierValue")
+_PREMIS_EVENT_DETAIL_INFORMATION = qname_text(NSMAP, "premis", "eventDetailInformation")
+_PREMIS_EVENT_DETAIL = qname_text(NSMAP, "premis", "eventDetail")
+_PREMIS_EVENT = qname_text(NSMAP, "premis", "event")
+_PREMIS_EVENT_TYPE = qname_text(NSMAP, "premis", "eventType")
+_PREMIS_EVENT_DATE_TIME = qname_text(NSMAP, "premis", "eventDateTime")
+_PREMIS_PREMIS = qname_text(NSMAP, "premis", "premis")
+
 
 class ObjectCategoryType(Enum):
     IE = "intellectual entity"
@@ -36,25 +112,55 @@ class ObjectType(Enum):
     REPRESENTATION = "representation"
 
 
+# UTF-8 bytes of the enum values and the fixed literal texts. lxml accepts
+# bytes for .text and skips the per-assignment encode step, so the encode
+# cost of these recurring values is paid once at import time.
+_SUBTYPE_TEXT = {
+    subtype: subtype.value.encode("utf-8") for subtype in RelationshipSubtype
+}
+_CATEGORY_TEXT = {
+    category: category.value.encode("utf-8") for category in ObjectCategoryType
+}
+_TEXT_UUID = b"UUID"
+_TEXT_STRUCTURAL = b"structural"
+_TEXT_MD5 = b"MD5"
+
+# Shared sentinel for wrappers constructed without optional children. Most
+# instances never receive any, so they share this tuple instead of each
+# allocating an empty list; the add_* methods upgrade to a list on first use.
+_EMPTY: tuple = ()
+
+
+def _make_element(parent, tag, **kwargs):
+    """Create an element, directly attached to the parent when one is given.
+
+    Building a node inside the parent's document avoids the move lxml
+    performs when a detached element is appended later.
+    """
+    if parent is None:
+        return etree.Element(tag, **kwargs)
+    return etree.SubElement(parent, tag, **kwargs)
+
+
 class OriginalName:
     """Class representing a originalName node.
 
     Args:
         name: The original name."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the originalName node as an lxml element.
 
         Returns:
             The originalName element."""
 
         # Premis original name
-        original_name_element = etree.Element(
-            qname_text(NSMAP, "premis", "originalName")
-        )
+        original_name_element = _make_element(parent, _PREMIS_ORIGINAL_NAME)
         original_name_element.text = self.name
 
         return original_name_element
@@ -67,29 +173,29 @@ class ObjectIdentifier:
         type: The type of the object identifier.
         value: The value of the object identifier."""
 
+    __slots__ = ("type", "value")
+
     def __init__(self, type: str, value: str):
         self.type = type
         self.value = value
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the objectIdentifier node as an lxml element.
 
         Returns:
             The objectIdentifier element."""
 
         # Premis object identifier
-        object_identifier_element = etree.Element(
-            qname_text(NSMAP, "premis", "objectIdentifier")
-        )
+        object_identifier_element = _make_element(parent, _PREMIS_OBJECT_IDENTIFIER)
         # Premis object identifier type
         etree.SubElement(
             object_identifier_element,
-            qname_text(NSMAP, "premis", "objectIdentifierType"),
+            _PREMIS_OBJECT_IDENTIFIER_TYPE,
         ).text = self.type
         # Premis object identifier value
         etree.SubElement(
             object_identifier_element,
-            qname_text(NSMAP, "premis", "objectIdentifierValue"),
+            _PREMIS_OBJECT_IDENTIFIER_VALUE,
         ).text = self.value
 
         return object_identifier_element
@@ -101,28 +207,30 @@ class RelatedObjectIdentifier:
     Args:
         uuid: The uuid."""
 
+    __slots__ = ("uuid",)
+
     def __init__(self, uuid: str):
         self.uuid = uuid
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the relatedObjectIdentifier node as an lxml element.
 
         Returns:
             The relatedObjectIdentifier element."""
 
         # Premis related object identifier
-        object_identifier_element = etree.Element(
-            qname_text(NSMAP, "premis", "relatedObjectIdentifier")
+        object_identifier_element = _make_element(
+            parent, _PREMIS_RELATED_OBJECT_IDENTIFIER
         )
         # Premis related object identifier type
         etree.SubElement(
             object_identifier_element,
-            qname_text(NSMAP, "premis", "relatedObjectIdentifierType"),
-        ).text = "UUID"
+            _PREMIS_RELATED_OBJECT_IDENTIFIER_TYPE,
+        ).text = _TEXT_UUID
         # Premis related object identifier value
         etree.SubElement(
             object_identifier_element,
-            qname_text(NSMAP, "premis", "relatedObjectIdentifierValue"),
+            _PREMIS_RELATED_OBJECT_IDENTIFIER_VALUE,
         ).text = self.uuid
 
         return object_identifier_element
@@ -145,47 +253,53 @@ class Relationship:
         RelationshipSubtype.REQUIRES: "req",
     }
 
+    # The authority attributes are fixed per subtype, so build them once at
+    # import time instead of once per relationship node
+    _TYPE_ATTRS = {
+        "authority": "relationshipType",
+        "authorityURI": "http://id.loc.gov/vocabulary/preservation/relationshipType",
+        "valueURI": "http://id.loc.gov/vocabulary/preservation/relationshipType/str",
+    }
+    _SUBTYPE_ATTRS = {
+        subtype: {
+            "authority": "relationshipSubType",
+            "authorityURI": "http://id.loc.gov/vocabulary/preservation/relationshipSubType",
+            "valueURI": f"http://id.loc.gov/vocabulary/preservation/relationshipSubType/{suffix}",
+        }
+        for subtype, suffix in TYPE_URI_MAP.items()
+    }
+
+    __slots__ = ("subtype", "uuids")
+
     def __init__(self, subtype: RelationshipSubtype, uuids: list[str]):
         self.subtype = subtype
         self.uuids = uuids
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the relationship node as an lxml element.
 
         Returns:
             The relationship element."""
 
         # Premis relationship
-        relationship_element = etree.Element(
-            qname_text(NSMAP, "premis", "relationship")
-        )
+        relationship_element = _make_element(parent, _PREMIS_RELATIONSHIP)
         # type
-        relationship_type_attributes = {
-            "authority": "relationshipType",
-            "authorityURI": "http://id.loc.gov/vocabulary/preservation/relationshipType",
-            "valueURI": "http://id.loc.gov/vocabulary/preservation/relationshipType/str",
-        }
         etree.SubElement(
             relationship_element,
-            qname_text(NSMAP, "premis", "relationshipType"),
-            attrib=relationship_type_attributes,
-        ).text = "structural"
+            _PREMIS_RELATIONSHIP_TYPE,
+            attrib=self._TYPE_ATTRS,
+        ).text = _TEXT_STRUCTURAL
 
         # Subtype
-        relationship_subtype_attributes = {
-            "authority": "relationshipSubType",
-            "authorityURI": "http://id.loc.gov/vocabulary/preservation/relationshipSubType",
-            "valueURI": f"http://id.loc.gov/vocabulary/preservation/relationshipSubType/{self.TYPE_URI_MAP[self.subtype]}",
-        }
         etree.SubElement(
             relationship_element,
-            qname_text(NSMAP, "premis", "relationshipSubtype"),
-            attrib=relationship_subtype_attributes,
-        ).text = self.subtype.value
+            _PREMIS_RELATIONSHIP_SUBTYPE,
+            attrib=self._SUBTYPE_ATTRS[self.subtype],
+        ).text = _SUBTYPE_TEXT[self.subtype]
 
-        # Related object identifier
+        # Related object identifiers
         for uuid in self.uuids:
-            relationship_element.append(RelatedObjectIdentifier(uuid).to_element())
+            RelatedObjectIdentifier(uuid).to_element(relationship_element)
 
         return relationship_element
 
@@ -197,10 +311,19 @@ class Fixity:
         md5: The md5.
     """
 
+    # Fixed authority attributes of the md5 digest algorithm node
+    _MD5_ALGO_ATTRS = {
+        "authority": "cryptographicHashFunctions",
+        "authorityURI": "http://id.loc.gov/vocabulary/preservation/cryptographicHashFunctions",
+        "valueURI": "http://id.loc.gov/vocabulary/preservation/cryptographicHashFunctions/md5",
+    }
+
+    __slots__ = ("md5",)
+
     def __init__(self, md5: str = ""):
         self.md5 = md5
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the fixity node as an lxml element.
 
         If the md5 value is empty, the fixity node will be empty.
@@ -209,26 +332,22 @@ class Fixity:
             The Premis fixity element."""
 
         # Premis object characteristics
-        object_characteristics_element = etree.Element(
-            qname_text(NSMAP, "premis", "objectCharacteristics"),
+        object_characteristics_element = _make_element(
+            parent, _PREMIS_OBJECT_CHARACTERISTICS
         )
         fixity_element = etree.SubElement(
             object_characteristics_element,
-            qname_text(NSMAP, "premis", "fixity"),
+            _PREMIS_FIXITY,
         )
         if self.md5:
             etree.SubElement(
                 fixity_element,
-                qname_text(NSMAP, "premis", "messageDigestAlgorithm"),
-                attrib={
-                    "authority": "cryptographicHashFunctions",
-                    "authorityURI": "http://id.loc.gov/vocabulary/preservation/cryptographicHashFunctions",
-                    "valueURI": "http://id.loc.gov/vocabulary/preservation/cryptographicHashFunctions/md5",
-                },
-            ).text = "MD5"
+                _PREMIS_MESSAGE_DIGEST_ALGORITHM,
+                attrib=self._MD5_ALGO_ATTRS,
+            ).text = _TEXT_MD5
             etree.SubElement(
                 fixity_element,
-                qname_text(NSMAP, "premis", "messageDigest"),
+                _PREMIS_MESSAGE_DIGEST,
             ).text = self.md5
 
         return object_characteristics_element
@@ -240,20 +359,20 @@ class ObjectCategory:
     Args:
         category: The category."""
 
+    __slots__ = ("category",)
+
     def __init__(self, category: ObjectCategoryType):
         self.category = category
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the objectCategory node as an lxml element.
 
         Returns:
             The objectCategory element."""
 
         # Premis object category
-        object_category_element = etree.Element(
-            qname_text(NSMAP, "premis", "objectCategory"),
-        )
-        object_category_element.text = self.category.value
+        object_category_element = _make_element(parent, _PREMIS_OBJECT_CATEGORY)
+        object_category_element.text = _CATEGORY_TEXT[self.category]
 
         return object_category_element
 
@@ -267,22 +386,22 @@ class Storage:
         storage_medium: The storage medium.
     """
 
+    __slots__ = ("storage_medium",)
+
     def __init__(self, storage_medium: str):
         self.storage_medium = storage_medium
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the storage node as an lxml element.
 
         Returns:
             The storage element."""
 
         # Premis storage
-        storage_element = etree.Element(
-            qname_text(NSMAP, "premis", "storage"),
-        )
+        storage_element = _make_element(parent, _PREMIS_STORAGE)
         etree.SubElement(
             storage_element,
-            qname_text(NSMAP, "premis", "storageMedium"),
+            _PREMIS_STORAGE_MEDIUM,
         ).text = self.storage_medium
 
         return storage_element
@@ -295,27 +414,29 @@ class SignificantPropertiesExtension:
         brand_name: The brand name of the material carrier.
     """
 
+    __slots__ = ("brand_name",)
+
     def __init__(self, brand_name: str | None = None):
         self.brand_name = brand_name
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the significant properties extension node as an lxml element.
 
         Returns:
             The significant properties extension element."""
 
         # Significant properties extension
-        extension_element = etree.Element(
-            qname_text(NSMAP, "premis", "significantPropertiesExtension")
+        extension_element = _make_element(
+            parent, _PREMIS_SIGNIFICANT_PROPERTIES_EXTENSION
         )
         if self.brand_name:
             brand_element = etree.SubElement(
                 extension_element,
-                qname_text(NSMAP, "schema", "brand"),
+                _SCHEMA_BRAND,
             )
             etree.SubElement(
                 brand_element,
-                qname_text(NSMAP, "schema", "name"),
+                _SCHEMA_NAME,
             ).text = self.brand_name
 
         return extension_element
@@ -330,6 +451,8 @@ class SignificantProperties:
         extension: The significant property extension.
     """
 
+    __slots__ = ("type", "value", "extension")
+
     def __init__(
         self,
         type: str | None = None,
@@ -340,32 +463,32 @@ class SignificantProperties:
         self.value = value
         self.extension = extension
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the significant properties node as an lxml element.
 
         Returns:
             The significant properties element."""
 
         # Significant properties
-        significant_properties_element = etree.Element(
-            qname_text(NSMAP, "premis", "significantProperties")
+        significant_properties_element = _make_element(
+            parent, _PREMIS_SIGNIFICANT_PROPERTIES
         )
 
         # Significant properties type
         if self.type:
             etree.SubElement(
                 significant_properties_element,
-                qname_text(NSMAP, "premis", "significantPropertiesType"),
+                _PREMIS_SIGNIFICANT_PROPERTIES_TYPE,
             ).text = self.type
         # Significant properties value
         if self.value:
             etree.SubElement(
                 significant_properties_element,
-                qname_text(NSMAP, "premis", "significantPropertiesValue"),
+                _PREMIS_SIGNIFICANT_PROPERTIES_VALUE,
             ).text = self.value
 
         if self.extension:
-            significant_properties_element.append(self.extension.to_element())
+            self.extension.to_element(significant_properties_element)
 
         return significant_properties_element
 
@@ -382,6 +505,23 @@ class Object:
         storages: The storages.
     """
 
+    __slots__ = (
+        "type",
+        "identifiers",
+        "original_name",
+        "fixity",
+        "relationships",
+        "storages",
+        "significant_properties",
+    )
+
+    # The xsi:type attribute dict is fixed per object type, so build the
+    # three variants once at import time
+    _XSI_TYPE_ATTRS = {
+        object_type: {_XSI_TYPE: f"premis:{object_type.value}"}
+        for object_type in ObjectType
+    }
+
     def __init__(
         self,
         type: ObjectType,
@@ -396,61 +536,67 @@ class Object:
         self.identifiers = identifiers
         self.original_name = original_name
         self.fixity = fixity
-        self.relationships = relationships if relationships else []
-        self.storages = storages if storages else []
+        self.relationships = relationships if relationships else _EMPTY
+        self.storages = storages if storages else _EMPTY
         self.significant_properties = (
-            significant_properties if significant_properties else []
+            significant_properties if significant_properties else _EMPTY
         )
 
     def add_relationship(self, relationship: Relationship):
-        self.relationships.append(relationship)
+        if self.relationships is _EMPTY:
+            self.relationships = [relationship]
+        else:
+            self.relationships.append(relationship)
 
     def add_identifier(self, identifier: ObjectIdentifier):
         self.identifiers.append(identifier)
 
     def add_storage(self, storage: Storage):
-        self.storages.append(storage)
+        if self.storages is _EMPTY:
+            self.storages = [storage]
+        else:
+            self.storages.append(storage)
 
     def add_significant_properties(self, significant_properties: SignificantProperties):
-        self.significant_properties.append(significant_properties)
+        if self.significant_properties is _EMPTY:
+            self.significant_properties = [significant_properties]
+        else:
+            self.significant_properties.append(significant_properties)
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the object node as an lxml element.
 
         Returns:
             The object element."""
 
         # Premis object
-        object_attributes = {
-            qname_text(NSMAP, "xsi", "type"): f"premis:{self.type.value}"
-        }
-        object_element = etree.Element(
-            qname_text(NSMAP, "premis", "object"), attrib=object_attributes
+        object_element = _make_element(
+            parent, _PREMIS_OBJECT, attrib=self._XSI_TYPE_ATTRS[self.type]
         )
 
         # Premis original name
         if self.original_name:
-            object_element.append(self.original_name.to_element())
+            self.original_name.to_element(object_element)
 
         # Premis object identifiers
         for identifier in self.identifiers:
-            object_element.append(identifier.to_element())
+            identifier.to_element(object_element)
 
         # Premis fixity
         if self.fixity:
-            object_element.append(self.fixity.to_element())
+            self.fixity.to_element(object_element)
 
         # Storage
         for storage in self.storages:
-            object_element.append(storage.to_element())
+            storage.to_element(object_element)
 
         # Premis relationships
         for relationship in self.relationships:
-            object_element.append(relationship.to_element())
+            relationship.to_element(object_element)
 
         # Premis significant properties
         for significant_property in self.significant_properties:
-            object_element.append(significant_property.to_element())
+            significant_property.to_element(object_element)
 
         return object_element
 
@@ -464,29 +610,29 @@ class AgentIdentifier:
         type: The type of the agent identifier.
         value: The value of the agent identifier."""
 
+    __slots__ = ("type", "value")
+
     def __init__(self, type: str, value: str):
         self.type = type
         self.value = value
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the agentIdentifier node as an lxml element.
 
         Returns:
             The agentIdentifier element."""
 
         # Premis agent identifier
-        agent_identifier_element = etree.Element(
-            qname_text(NSMAP, "premis", "agentIdentifier")
-        )
+        agent_identifier_element = _make_element(parent, _PREMIS_AGENT_IDENTIFIER)
         # Premis agent identifier type
         etree.SubElement(
             agent_identifier_element,
-            qname_text(NSMAP, "premis", "agentIdentifierType"),
+            _PREMIS_AGENT_IDENTIFIER_TYPE,
         ).text = self.type
         # Premis agent identifier value
         etree.SubElement(
             agent_identifier_element,
-            qname_text(NSMAP, "premis", "agentIdentifierValue"),
+            _PREMIS_AGENT_IDENTIFIER_VALUE,
         ).text = self.value
 
         return agent_identifier_element
@@ -503,6 +649,8 @@ class AgentExtension:
         serial_number: The serial number.
     """
 
+    __slots__ = ("model", "brand_name", "serial_number")
+
     def __init__(
         self,
         model: str = "",
@@ -513,40 +661,38 @@ class AgentExtension:
         self.brand_name = brand_name
         self.serial_number = serial_number
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the agent extension as an lxml element.
 
         Returns:
             The agent extension element."""
 
         # Premis agent extension
-        agent_extension_element = etree.Element(
-            qname_text(NSMAP, "premis", "agentExtension")
-        )
+        agent_extension_element = _make_element(parent, _PREMIS_AGENT_EXTENSION)
 
         # Premis agent extension model
         if self.model:
             etree.SubElement(
                 agent_extension_element,
-                qname_text(NSMAP, "schema", "model"),
+                _SCHEMA_MODEL,
             ).text = self.model
 
         # Premis agent extension brand
         if self.brand_name:
             brand_element = etree.SubElement(
                 agent_extension_element,
-                qname_text(NSMAP, "schema", "brand"),
+                _SCHEMA_BRAND,
             )
             etree.SubElement(
                 brand_element,
-                qname_text(NSMAP, "schema", "name"),
+                _SCHEMA_NAME,
             ).text = self.brand_name
 
         # Premis agent extension serial number
         if self.serial_number:
             etree.SubElement(
                 agent_extension_element,
-                qname_text(NSMAP, "schema", "serialNumber"),
+                _SCHEMA_SERIAL_NUMBER,
             ).text = self.serial_number
 
         return agent_extension_element
@@ -561,6 +707,8 @@ class Agent:
         type: The agent type.
     """
 
+    __slots__ = ("identifiers", "type", "name", "extension")
+
     def __init__(
         self,
         identifiers: list[AgentIdentifier],
@@ -576,36 +724,36 @@ class Agent:
     def add_identifier(self, identifier: AgentIdentifier):
         self.identifiers.append(identifier)
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the agent node as an lxml element.
 
         Returns:
             The agent element."""
 
         # Premis agent
-        agent_element = etree.Element(qname_text(NSMAP, "premis", "agent"))
+        agent_element = _make_element(parent, _PREMIS_AGENT)
 
         # Premis object identifiers
         for identifier in self.identifiers:
-            agent_element.append(identifier.to_element())
+            identifier.to_element(agent_element)
 
         # Premis agent name
         if self.name:
             etree.SubElement(
                 agent_element,
-                qname_text(NSMAP, "premis", "agentName"),
+                _PREMIS_AGENT_NAME,
             ).text = self.name
 
         # Premis agent type
         if self.type:
             etree.SubElement(
                 agent_element,
-                qname_text(NSMAP, "premis", "agentType"),
+                _PREMIS_AGENT_TYPE,
             ).text = self.type
 
         # Premis agent extension
         if self.extension:
-            agent_element.append(self.extension.to_element())
+            self.extension.to_element(agent_element)
 
         return agent_element
 
@@ -619,24 +767,28 @@ class LinkingAgentRole:
         role: The role.
         value_uri: The value URI."""
 
+    __slots__ = ("role", "value_uri")
+
     def __init__(self, role: str, value_uri: str = ""):
         self.role = role
         self.value_uri = value_uri
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the linkingAgentRole node as an lxml element.
 
         Returns:
             The linkingAgentRole element."""
 
-        attributes = {}
+        # Linking agent role. Only build an attrib dict when there is a
+        # value URI to carry.
         if self.value_uri:
-            attributes["valueURI"] = self.value_uri
-
-        # Linking agent role
-        linking_agent_role_element = etree.Element(
-            qname_text(NSMAP, "premis", "linkingAgentRole"), attrib=attributes
-        )
+            linking_agent_role_element = _make_element(
+                parent, _PREMIS_LINKING_AGENT_ROLE, attrib={"valueURI": self.value_uri}
+            )
+        else:
+            linking_agent_role_element = _make_element(
+                parent, _PREMIS_LINKING_AGENT_ROLE
+            )
         linking_agent_role_element.text = self.role
 
         return linking_agent_role_element
@@ -650,39 +802,44 @@ class LinkingAgentIdentifier:
         value: The value of the linking agent identifier.
         roles: The roles of the linking agent identifier."""
 
+    __slots__ = ("type", "value", "roles")
+
     def __init__(
         self, type: str, value: str, roles: list[LinkingAgentRole] | None = None
     ):
         self.type = type
         self.value = value
-        self.roles = roles if roles else []
+        self.roles = roles if roles else _EMPTY
 
     def add_role(self, role: LinkingAgentRole):
-        self.roles.append(role)
+        if self.roles is _EMPTY:
+            self.roles = [role]
+        else:
+            self.roles.append(role)
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the LinkingAgentIdentifier node as an lxml element.
 
         Returns:
             The LinkingAgentIdentifier element."""
 
         # Linking agent identifier
-        linking_agent_identifier_element = etree.Element(
-            qname_text(NSMAP, "premis", "linkingAgentIdentifier")
+        linking_agent_identifier_element = _make_element(
+            parent, _PREMIS_LINKING_AGENT_IDENTIFIER
         )
         # Linking agent identifier type
         etree.SubElement(
             linking_agent_identifier_element,
-            qname_text(NSMAP, "premis", "linkingAgentIdentifierType"),
+            _PREMIS_LINKING_AGENT_IDENTIFIER_TYPE,
         ).text = self.type
         # Linking agent identifier value
         etree.SubElement(
             linking_agent_identifier_element,
-            qname_text(NSMAP, "premis", "linkingAgentIdentifierValue"),
+            _PREMIS_LINKING_AGENT_IDENTIFIER_VALUE,
         ).text = self.value
         # linking agent identifier roles
         for role in self.roles:
-            linking_agent_identifier_element.append(role.to_element())
+            role.to_element(linking_agent_identifier_element)
 
         return linking_agent_identifier_element
 
@@ -696,24 +853,28 @@ class LinkingObjectRole:
         role: The role.
         value_uri: The value URI."""
 
+    __slots__ = ("role", "value_uri")
+
     def __init__(self, role: str, value_uri: str = ""):
         self.role = role
         self.value_uri = value_uri
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the linkingObjectRole node as an lxml element.
 
         Returns:
             The linkingObjectRole element."""
 
-        attributes = {}
+        # Linking object role. Only build an attrib dict when there is a
+        # value URI to carry.
         if self.value_uri:
-            attributes["valueURI"] = self.value_uri
-
-        # Linking agent role
-        linking_agent_role_element = etree.Element(
-            qname_text(NSMAP, "premis", "linkingObjectRole"), attrib=attributes
-        )
+            linking_agent_role_element = _make_element(
+                parent, _PREMIS_LINKING_OBJECT_ROLE, attrib={"valueURI": self.value_uri}
+            )
+        else:
+            linking_agent_role_element = _make_element(
+                parent, _PREMIS_LINKING_OBJECT_ROLE
+            )
         linking_agent_role_element.text = self.role
 
         return linking_agent_role_element
@@ -727,39 +888,44 @@ class LinkingObjectIdentifier:
         value: The value of the linking object identifier.
         rol: The roles of the linking object identifier."""
 
+    __slots__ = ("type", "value", "roles")
+
     def __init__(
         self, type: str, value: str, roles: list[LinkingObjectRole] | None = None
     ):
         self.type = type
         self.value = value
-        self.roles = roles if roles else []
+        self.roles = roles if roles else _EMPTY
 
     def add_role(self, role: LinkingObjectRole):
-        self.roles.append(role)
+        if self.roles is _EMPTY:
+            self.roles = [role]
+        else:
+            self.roles.append(role)
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the linkingObjectIdentifier node as an lxml element.
 
         Returns:
             The linkingObjectIdentifier element."""
 
         # Linking object identifier
-        linking_object_identifier_element = etree.Element(
-            qname_text(NSMAP, "premis", "linkingObjectIdentifier")
+        linking_object_identifier_element = _make_element(
+            parent, _PREMIS_LINKING_OBJECT_IDENTIFIER
         )
         # Linking object identifier type
         etree.SubElement(
             linking_object_identifier_element,
-            qname_text(NSMAP, "premis", "linkingObjectIdentifierType"),
+            _PREMIS_LINKING_OBJECT_IDENTIFIER_TYPE,
         ).text = self.type
         # Linking object identifier value
         etree.SubElement(
             linking_object_identifier_element,
-            qname_text(NSMAP, "premis", "linkingObjectIdentifierValue"),
+            _PREMIS_LINKING_OBJECT_IDENTIFIER_VALUE,
         ).text = self.value
         # linking object identifier roles
         for role in self.roles:
-            linking_object_identifier_element.append(role.to_element())
+            role.to_element(linking_object_identifier_element)
 
         return linking_object_identifier_element
 
@@ -773,29 +939,29 @@ class EventIdentifier:
         type: The type of the event identifier.
         value: The value of the event identifier."""
 
+    __slots__ = ("type", "value")
+
     def __init__(self, type: str, value: str):
         self.type = type
         self.value = value
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the eventIdentifier node as an lxml element.
 
         Returns:
             The eventIdentifier element."""
 
         # Premis event identifier
-        event_identifier_element = etree.Element(
-            qname_text(NSMAP, "premis", "eventIdentifier")
-        )
+        event_identifier_element = _make_element(parent, _PREMIS_EVENT_IDENTIFIER)
         # Premis event identifier type
         etree.SubElement(
             event_identifier_element,
-            qname_text(NSMAP, "premis", "eventIdentifierType"),
+            _PREMIS_EVENT_IDENTIFIER_TYPE,
         ).text = self.type
         # Premis event identifier value
         etree.SubElement(
             event_identifier_element,
-            qname_text(NSMAP, "premis", "eventIdentifierValue"),
+            _PREMIS_EVENT_IDENTIFIER_VALUE,
         ).text = self.value
 
         return event_identifier_element
@@ -809,23 +975,25 @@ class EventDetailInformation:
     Args:
         detail: The detail"""
 
+    __slots__ = ("detail",)
+
     def __init__(self, detail: str):
         self.detail = detail
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the eventDetailInformation node as an lxml element.
 
         Returns:
             The eventDetailInformation element."""
 
         # Premis event detail information
-        event_detail_information_element = etree.Element(
-            qname_text(NSMAP, "premis", "eventDetailInformation")
+        event_detail_information_element = _make_element(
+            parent, _PREMIS_EVENT_DETAIL_INFORMATION
         )
         # Premis event detail
         etree.SubElement(
             event_detail_information_element,
-            qname_text(NSMAP, "premis", "eventDetail"),
+            _PREMIS_EVENT_DETAIL,
         ).text = self.detail
 
         return event_detail_information_element
@@ -844,6 +1012,15 @@ class Event:
         linking_object_identifiers: The linking object identifiers.
     """
 
+    __slots__ = (
+        "identifier",
+        "type",
+        "date_time",
+        "event_detail_informations",
+        "linking_agent_identifiers",
+        "linking_object_identifiers",
+    )
+
     def __init__(
         self,
         identifier: EventIdentifier,
@@ -857,50 +1034,50 @@ class Event:
         self.type = type
         self.date_time = date_time
         self.event_detail_informations = (
-            event_detail_informations if event_detail_informations else []
+            event_detail_informations if event_detail_informations else _EMPTY
         )
         self.linking_agent_identifiers = (
-            linking_agent_identifiers if linking_agent_identifiers else []
+            linking_agent_identifiers if linking_agent_identifiers else _EMPTY
         )
         self.linking_object_identifiers = (
-            linking_object_identifiers if linking_object_identifiers else []
+            linking_object_identifiers if linking_object_identifiers else _EMPTY
         )
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the event node as an lxml element.
 
         Returns:
             The event element."""
 
         # Premis event
-        event_element = etree.Element(qname_text(NSMAP, "premis", "event"))
+        event_element = _make_element(parent, _PREMIS_EVENT)
 
         # Premis object identifier
-        event_element.append(self.identifier.to_element())
+        self.identifier.to_element(event_element)
 
         # Premis event type
         etree.SubElement(
             event_element,
-            qname_text(NSMAP, "premis", "eventType"),
+            _PREMIS_EVENT_TYPE,
         ).text = self.type
 
         # Premis event datetime
         etree.SubElement(
             event_element,
-            qname_text(NSMAP, "premis", "eventDateTime"),
+            _PREMIS_EVENT_DATE_TIME,
         ).text = self.date_time
 
         # Premis event detail information (note)
         for event_detail_information in self.event_detail_informations:
-            event_element.append(event_detail_information.to_element())
+            event_detail_information.to_element(event_element)
 
         # The linking agent identifiers
         for linking_agent_identifier in self.linking_agent_identifiers:
-            event_element.append(linking_agent_identifier.to_element())
+            linking_agent_identifier.to_element(event_element)
 
         # The linking object identifiers
         for linking_object_identifier in self.linking_object_identifiers:
-            event_element.append(linking_object_identifier.to_element())
+            linking_object_identifier.to_element(event_element)
 
         return event_element
 
@@ -910,6 +1087,8 @@ class Premis:
 
     ATTRS = {"version": "3.0"}
 
+    __slots__ = ("objects", "events", "agents")
+
     def __init__(self):
         self.objects: list[Object] = []
         self.events: list[Event] = []
@@ -924,26 +1103,46 @@ class Premis:
     def add_agent(self, agent: Agent):
         self.agents.append(agent)
 
-    def to_element(self):
+    def to_element(self, parent=None):
         """Returns the premis node as an lxml element.
 
         Returns:
             The premis element."""
 
         # Premis premis
-        premis_element = etree.Element(
-            qname_text(NSMAP, "premis", "premis"), nsmap=NSMAP, attrib=self.ATTRS
+        premis_element = _make_element(
+            parent, _PREMIS_PREMIS, nsmap=NSMAP, attrib=self.ATTRS
         )
         # Add the objects
         for obj in self.objects:
-            premis_element.append(obj.to_element())
+            obj.to_element(premis_element)
 
         # Add the events
         for event in self.events:
-            premis_element.append(event.to_element())
+            event.to_element(premis_element)
 
         # Add the agents
         for agent in self.agents:
-            premis_element.append(agent.to_element())
+            agent.to_element(premis_element)
 
         return premis_element
+
+    def write_xml(self, fileobj):
+        """Stream the premis document to a binary file object.
+
+        Each object, event and agent subtree is serialized as soon as it is
+        built, so the peak memory is one subtree instead of the complete
+        document tree plus its serialized bytes.
+
+        Args:
+            fileobj: The binary file object to write to.
+        """
+        with etree.xmlfile(fileobj, encoding="utf-8") as xml_file:
+            xml_file.write_declaration()
+            with xml_file.element(_PREMIS_PREMIS, nsmap=NSMAP, attrib=self.ATTRS):
+                for obj in self.objects:
+                    xml_file.write(obj.to_element())
+                for event in self.events:
+                    xml_file.write(event.to_element())
+                for agent in self.agents:
+                    xml_file.write(agent.to_element())
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import threading
 from pathlib import Path
 from lxml import etree
 from lxml.etree import XMLSyntaxError
@@ -10,52 +11,130 @@ class InvalidSidecarException(Exception):
     pass
 
 
+# Reused parser for all sidecars. They are small, flat documents, so skip
+# collecting xml:id attributes and disallow huge trees. Sidecars are parsed
+# on the worker pool, and lxml parsers must not be shared between threads
+# concurrently, so each thread gets its own instance.
+_LOCAL = threading.local()
+
+
+def _parser() -> etree.XMLParser:
+    try:
+        return _LOCAL.parser
+    except AttributeError:
+        _LOCAL.parser = etree.XMLParser(collect_ids=False, huge_tree=False)
+        return _LOCAL.parser
+
+
+# The top-level sidecar fields that are read into attributes. Collected in a
+# single pass over the root's children instead of one findtext traversal per
+# field.
+_TOP_LEVEL_FIELDS = frozenset(
+    {
+        "md5",
+        "CP_id",
+        "dc_source",
+        "dc_identifier_localid",
+        "type_viaa",
+        "format",
+        "sp_name",
+        "sp_id",
+        "digitization_date",
+        "digitization_time",
+        "digitization_note",
+        "player_manufacturer",
+        "player_serial_number",
+        "player_model",
+        "collection_box_barcode",
+        "carrier_barcode",
+        "transport_box_barcode",
+        "brand",
+        "batch_id",
+    }
+)
+
+
 class Sidecar:
     """Class used for parsing the metadata sidecar of the essence pair."""
 
+    __slots__ = (
+        "root",
+        "md5",
+        "cp_id",
+        "dc_source",
+        "local_id_filename",
+        "local_id",
+        "local_ids",
+        "type_viaa",
+        "format",
+        "sp_name",
+        "sp_id",
+        "digitization_date",
+        "digitization_time",
+        "digitization_note",
+        "player_manufacturer",
+        "player_serial_number",
+        "player_model",
+        "collection_box_barcode",
+        "carrier_barcode",
+        "transport_box_barcode",
+        "brand",
+        "batch_id",
+    )
+
     def __init__(self, path: Path):
         try:
-            self.root = etree.parse(str(path))
+            self.root = etree.parse(str(path), _parser())
         except XMLSyntaxError as e:
             raise InvalidSidecarException(f"XML syntax error: '{e}'")
+        # Collect all fields in a single pass over the root's children
+        # instead of one full findtext traversal per field. Like findtext,
+        # an element without text yields an empty string.
+        values: dict = {}
+        local_ids: dict = {}
+        for child in self.root.getroot().iterchildren():
+            tag = child.tag
+            if tag in _TOP_LEVEL_FIELDS:
+                values[tag] = child.text if child.text is not None else ""
+            elif tag == "dc_identifier_localids":
+                for lid in child.iterchildren():
+                    local_ids[lid.tag] = lid.text
+
         # Mandatory
-        self.md5 = self.root.findtext("md5")
+        self.md5 = values.get("md5")
         if not self.md5:
             raise InvalidSidecarException("Missing mandatory key: 'md5'")
+        # Normalise once, so users of the md5 don't need to lowercase it
+        # on every comparison
+        self.md5 = self.md5.lower()
 
         # Optional
-        self.cp_id = self.root.findtext("CP_id")
-        self.dc_source = self.root.findtext("dc_source")
+        self.cp_id = values.get("CP_id")
+        self.dc_source = values.get("dc_source")
         # Ensure order: Bestandsnaam should have priority over bestandsnaam
-        self.local_id_filename = self.root.findtext(
-            "dc_identifier_localids/Bestandsnaam"
+        self.local_id_filename = local_ids.get("Bestandsnaam") or local_ids.get(
+            "bestandsnaam"
         )
-        if not self.local_id_filename:
-            self.local_id_filename = self.root.findtext(
-                "dc_identifier_localids/bestandsnaam"
-            )
-        self.local_id = self.root.findtext("dc_identifier_localid")
-        self.local_ids = {}
-        for lid in self.root.findall("dc_identifier_localids/*"):
-            self.local_ids[lid.tag] = lid.text
+        self.local_id = values.get("dc_identifier_localid")
+        self.local_ids = local_ids
         # XDCAM
-        self.type_viaa = self.root.findtext("type_viaa")
-        self.format = self.root.findtext("format")
-        self.sp_name = self.root.findtext("sp_name")
-        self.sp_id = self.root.findtext("sp_id")
-        self.digitization_date = self.root.findtext("digitization_date")
-        self.digitization_time = self.root.findtext("digitization_time")
-        self.digitization_note = self.root.findtext("digitization_note")
-        self.player_manufacturer = self.root.findtext("player_manufacturer")
-        self.player_serial_number = self.root.findtext("player_serial_number")
-        self.player_model = self.root.findtext("player_model")
-        self.collection_box_barcode = self.root.findtext("collection_box_barcode")
-        self.carrier_barcode = self.root.findtext("carrier_barcode")
-        self.transport_box_barcode = self.root.findtext("transport_box_barcode")
-        self.brand = self.root.findtext("brand")
+        self.type_viaa = values.get("type_viaa")
+        self.format = values.get("format")
+        self.sp_name = values.get("sp_name")
+        self.sp_id = values.get("sp_id")
+        self.digitization_date = values.get("digitization_date")
+        self.digitization_time = values.get("digitization_time")
+        self.digitization_note = values.get("digitization_note")
+        self.player_manufacturer = values.get("player_manufacturer")
+        self.player_serial_number = values.get("player_serial_number")
+        self.player_model = values.get("player_model")
+        self.collection_box_barcode = values.get("collection_box_barcode")
+        self.carrier_barcode = values.get("carrier_barcode")
+        self.transport_box_barcode = values.get("transport_box_barcode")
+        self.brand = values.get("brand")
 
         # Batch ID
-        self.batch_id = self.root.findtext("batch_id")
+        self.batch_id = values.get("batch_id")
 
     def calculate_original_filename(self) -> str | None:
         """Calculate the original filename.
@@ -16,7 +16,14 @@ class PulsarClient:
         self.client = pulsar.Client(
             f'pulsar://{self.pulsar_config["host"]}:{self.pulsar_config["port"]}'
         )
-        self.producer = self.client.create_producer(PRODUCER_TOPIC)
+        # Batch the produced events, so bursts of small events don't pay a
+        # broker round-trip each
+        self.producer = self.client.create_producer(
+            PRODUCER_TOPIC,
+            batching_enabled=True,
+            batching_max_messages=100,
+            batching_max_publish_delay_ms=10,
+        )
 
     def produce_event(self, event: Event):
         """Produce a cloudevent on a topic
@@ -31,6 +38,30 @@ class PulsarClient:
             event_timestamp=event.get_event_time_as_int(),
         )
 
+    def produce_event_async(self, event: Event, callback):
+        """Produce a cloudevent on a topic without blocking.
+
+        Args:
+            event: The cloudevent to send to the topic.
+            callback: Called with (result, message_id) once the broker has
+                confirmed the event.
+        """
+        msg = PulsarBinding.to_protocol(event, CEMessageMode.STRUCTURED)
+        self.producer.send_async(
+            msg.data,
+            callback,
+            properties=msg.attributes,
+            event_timestamp=event.get_event_time_as_int(),
+        )
+
+    def flush(self):
+        """Block until the broker has confirmed all produced events.
+
+        The delivery callbacks of pending events run before this returns.
+        """
+        self.producer.flush()
+
     def close(self):
         """Close the open producers"""
+        self.producer.flush()
         self.producer.close()
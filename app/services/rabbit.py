@@ -24,6 +24,12 @@ class RabbitClient:
                 host=self.rabbit_config["host"],
                 port=self.rabbit_config["port"],
                 credentials=self.credentials,
+                # The consume loop itself never blocks, as SIP creation runs
+                # on the worker pool. An explicit, short heartbeat detects
+                # dead connections quickly instead of relying on the broker
+                # default.
+                heartbeat=30,
+                blocked_connection_timeout=300,
             )
         )
 
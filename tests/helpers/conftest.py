@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+
+import pytest
+
+from app.helpers.events import WatchfolderMessage
+from app.helpers.sidecar import Sidecar
+from tests.helpers import load_resource
+
+sidecar_folder = Path("tests", "resources", "sidecar")
+watchfolder_folder = Path("tests", "resources", "watchfolder")
+
+
+# The sidecar fixtures are session-scoped: the tests only read attributes of
+# the parsed sidecar, so each XML file is read and parsed once per session.
+@pytest.fixture(scope="session")
+def sidecar_default():
+    return Sidecar(sidecar_folder.joinpath("sidecar.xml"))
+
+
+@pytest.fixture(scope="session")
+def sidecar_xdcam():
+    return Sidecar(sidecar_folder.joinpath("sidecar_xdcam.xml"))
+
+
+@pytest.fixture(scope="session")
+def sidecar_batch_id():
+    return Sidecar(sidecar_folder.joinpath("sidecar_batch_id.xml"))
+
+
+# Likewise for the watchfolder messages: parsed once per session, the tests
+# only read from them.
+@pytest.fixture(scope="session")
+def watchfolder_message():
+    return WatchfolderMessage(
+        load_resource(watchfolder_folder.joinpath("message.json"))
+    )
+
+
+@pytest.fixture(scope="session")
+def watchfolder_message_collaterals():
+    return WatchfolderMessage(
+        load_resource(watchfolder_folder.joinpath("message_collaterals.json"))
+    )
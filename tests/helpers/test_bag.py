@@ -46,6 +46,8 @@ from app.helpers.bag import guess_mimetype, calculate_sip_type
         (".aif", "audio/aiff"),
         (".wma", "audio/x-ms-wma"),
         (".ac3", "audio/ac3"),
+        # An unknown extension has no mimetype
+        (".unknown", None),
     ],
 )
 def test_guess_mimetype(extension, mimetype):
@@ -57,11 +59,6 @@ def test_guess_mimetype(extension, mimetype):
     assert result_upper == mimetype
 
 
-def test_guess_mimetype_other():
-    result = guess_mimetype(Path("/folder", "file.unknown"))
-    assert result is None
-
-
 @pytest.mark.parametrize(
     "mimetype,sip_type",
     [
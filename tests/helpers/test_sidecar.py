@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import re
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -8,26 +10,37 @@ import pytest
 from app.helpers.sidecar import InvalidSidecarException, Sidecar
 
 
-def test_sidecar():
-    sidecar = Sidecar(Path("tests", "resources", "sidecar", "sidecar.xml"))
-    assert sidecar.md5 == "7e0ef8c24fe343d98fbb93b6a7db6ccb"
-    assert sidecar.cp_id == "CP ID"
-    assert sidecar.is_xdcam() is False
+folder = Path("tests", "resources", "sidecar")
+
+
+# Cache the parsed sidecars of the parametrized cases, so each file is read
+# and parsed once per run. The tests only read from the instances.
+@lru_cache(maxsize=None)
+def _sidecar(filename):
+    return Sidecar(folder.joinpath(filename))
+
+
+def test_sidecar(sidecar_default):
+    assert sidecar_default.md5 == "7e0ef8c24fe343d98fbb93b6a7db6ccb"
+    assert sidecar_default.cp_id == "CP ID"
+    assert sidecar_default.is_xdcam() is False
 
 
 def test_sidecar_no_md5():
-    with pytest.raises(InvalidSidecarException) as e:
-        Sidecar(Path("tests", "resources", "sidecar", "sidecar_no_md5.xml"))
-    assert str(e.value) == "Missing mandatory key: 'md5'"
+    with pytest.raises(
+        InvalidSidecarException, match=re.escape("Missing mandatory key: 'md5'")
+    ):
+        Sidecar(folder.joinpath("sidecar_no_md5.xml"))
 
 
 def test_sidecar_empty():
-    with pytest.raises(InvalidSidecarException) as e:
-        Sidecar(Path("tests", "resources", "sidecar", "sidecar_empty.xml"))
-    assert (
-        str(e.value)
-        == "XML syntax error: 'Document is empty, line 1, column 1 (sidecar_empty.xml, line 1)'"
-    )
+    with pytest.raises(
+        InvalidSidecarException,
+        match=re.escape(
+            "XML syntax error: 'Document is empty, line 1, column 1 (sidecar_empty.xml, line 1)'"
+        ),
+    ):
+        Sidecar(folder.joinpath("sidecar_empty.xml"))
 
 
 @pytest.mark.parametrize(
@@ -41,28 +54,25 @@ def test_sidecar_empty():
     ],
 )
 def test_sidecar_calculate_original_filename(input_file, bestandsnaam):
-    sidecar = Sidecar(Path("tests", "resources", "sidecar", input_file))
-    assert sidecar.calculate_original_filename() == bestandsnaam
-
-
-def test_sidecar_xdcam():
-    sidecar = Sidecar(Path("tests", "resources", "sidecar", "sidecar_xdcam.xml"))
-    assert sidecar.format == "XDCAM"
-    assert sidecar.digitization_date == "2022-05-24"
-    assert sidecar.digitization_time == "14:15:50"
-    assert sidecar.player_manufacturer == "SONY"
-    assert sidecar.player_model == "PDW-U4"
-    assert sidecar.player_serial_number == "0000000"
-    assert sidecar.sp_id == "SP ID"
-    assert sidecar.sp_name == "SP Name"
-    assert sidecar.type_viaa == "Video"
-    assert sidecar.is_xdcam() is True
-    assert sidecar.brand == "Brand"
-    assert sidecar.collection_box_barcode == "Collection box barcode"
-    assert sidecar.carrier_barcode == "Carrier barcode"
-    assert sidecar.transport_box_barcode == "Transport box barcode"
-
-
-def test_sidecar_batch_id():
-    sidecar = Sidecar(Path("tests", "resources", "sidecar", "sidecar_batch_id.xml"))
-    assert sidecar.batch_id == "Batch ID"
+    assert _sidecar(input_file).calculate_original_filename() == bestandsnaam
+
+
+def test_sidecar_xdcam(sidecar_xdcam):
+    assert sidecar_xdcam.format == "XDCAM"
+    assert sidecar_xdcam.digitization_date == "2022-05-24"
+    assert sidecar_xdcam.digitization_time == "14:15:50"
+    assert sidecar_xdcam.player_manufacturer == "SONY"
+    assert sidecar_xdcam.player_model == "PDW-U4"
+    assert sidecar_xdcam.player_serial_number == "0000000"
+    assert sidecar_xdcam.sp_id == "SP ID"
+    assert sidecar_xdcam.sp_name == "SP Name"
+    assert sidecar_xdcam.type_viaa == "Video"
+    assert sidecar_xdcam.is_xdcam() is True
+    assert sidecar_xdcam.brand == "Brand"
+    assert sidecar_xdcam.collection_box_barcode == "Collection box barcode"
+    assert sidecar_xdcam.carrier_barcode == "Carrier barcode"
+    assert sidecar_xdcam.transport_box_barcode == "Transport box barcode"
+
+
+def test_sidecar_batch_id(sidecar_batch_id):
+    assert sidecar_batch_id.batch_id == "Batch ID"